@@ -5,26 +5,15 @@ import json
 
 # from rich.prompt import Confirm
 import click
-import relecov_tools.download_manager
-import relecov_tools.log_summary
 import rich.console
 import rich.logging
 import rich.traceback
 
 import relecov_tools.utils
-import relecov_tools.assets.pipeline_utils.viralrecon
-import relecov_tools.read_lab_metadata
-import relecov_tools.download_manager
-import relecov_tools.json_validation
-import relecov_tools.map_schema
-import relecov_tools.upload_database
-import relecov_tools.read_bioinfo_metadata
-import relecov_tools.metadata_homogeneizer
-import relecov_tools.gisaid_upload
-import relecov_tools.upload_ena_protocol
-import relecov_tools.pipeline_manager
-import relecov_tools.build_schema
-import relecov_tools.dataprocess_wrapper
+
+# NOTE: subcommand modules are imported inside each command callback so that
+# launching the CLI (or asking for --help) does not pay the import cost of
+# every dependency (pandas, paramiko, Bio, openpyxl...) of every subcommand.
 
 log = logging.getLogger()
 
@@ -168,6 +157,20 @@ def relecov_tools_cli(verbose, log_file):
     default=None,
     help="Flag: Select which folders will be targeted giving [paths] or via prompt",
 )
+@click.option(
+    "-B",
+    "--buffer-size",
+    type=int,
+    default=131072,
+    help="Chunk size in bytes used when copying downloaded files",
+)
+@click.option(
+    "-R",
+    "--max-outstanding-reads",
+    type=int,
+    default=64,
+    help="Number of concurrent sftp read requests kept in flight per file",
+)
 def download(
     user,
     password,
@@ -175,8 +178,12 @@ def download(
     download_option,
     output_location,
     target_folders,
+    buffer_size,
+    max_outstanding_reads,
 ):
     """Download files located in sftp server."""
+    import relecov_tools.download_manager
+
     download_manager = relecov_tools.download_manager.DownloadManager(
         user,
         password,
@@ -184,6 +191,8 @@ def download(
         download_option,
         output_location,
         target_folders,
+        buffer_size,
+        max_outstanding_reads,
     )
     download_manager.execute_process()
 
@@ -209,6 +218,8 @@ def read_lab_metadata(metadata_file, sample_list_file, metadata_out):
     """
     Create the json compliant to the relecov schema from the Metadata file.
     """
+    import relecov_tools.read_lab_metadata
+
     new_metadata = relecov_tools.read_lab_metadata.RelecovMetadata(
         metadata_file, sample_list_file, metadata_out
     )
@@ -229,6 +240,8 @@ def read_lab_metadata(metadata_file, sample_list_file, metadata_out):
 @click.option("-o", "--out_folder", help="Path to save validate json file")
 def validate(json_file, json_schema, metadata, out_folder):
     """Validate json file against schema."""
+    import relecov_tools.json_validation
+
     validation = relecov_tools.json_validation.SchemaValidation(
         json_file, json_schema, metadata, out_folder
     )
@@ -249,6 +262,8 @@ def validate(json_file, json_schema, metadata, out_folder):
 @click.option("-o", "--output", help="File name and path to store the mapped json")
 def map(origin_schema, json_data, destination_schema, schema_file, output):
     """Convert data between phage plus schema to ENA, GISAID, or any other schema"""
+    import relecov_tools.map_schema
+
     new_schema = relecov_tools.map_schema.MappingSchema(
         origin_schema, json_data, destination_schema, schema_file, output
     )
@@ -285,6 +300,8 @@ def upload_to_ena(
     output_path,
 ):
     """parse data to create xml files to upload to ena"""
+    import relecov_tools.upload_ena_protocol
+
     upload_ena = relecov_tools.upload_ena_protocol.EnaUpload(
         user=user,
         passwd=password,
@@ -351,6 +368,8 @@ def upload_to_gisaid(
     gzip,
 ):
     """parsed data to create files to upload to gisaid"""
+    import relecov_tools.gisaid_upload
+
     upload_gisaid = relecov_tools.gisaid_upload.GisaidUpload(
         user,
         password,
@@ -402,6 +421,8 @@ def upload_to_gisaid(
 )
 def update_db(user, password, json, type, platform, server_url, full_update):
     """upload the information included in json file to the database"""
+    import relecov_tools.upload_database
+
     update_database_obj = relecov_tools.upload_database.UpdateDatabase(
         user, password, json, type, platform, server_url, full_update
     )
@@ -423,6 +444,8 @@ def read_bioinfo_metadata(json_file, input_folder, out_dir, software_name):
     """
     Create the json compliant  from the Bioinfo Metadata.
     """
+    import relecov_tools.read_bioinfo_metadata
+
     new_bioinfo_metadata = relecov_tools.read_bioinfo_metadata.BioinfoMetadata(
         json_file,
         input_folder,
@@ -450,6 +473,8 @@ def read_bioinfo_metadata(json_file, input_folder, out_dir, software_name):
 @click.option("-o", "--output", type=click.Path(), help="Path to save json output")
 def metadata_homogeneizer(institution, directory, output):
     """Parse institution metadata lab to the one used in relecov"""
+    import relecov_tools.metadata_homogeneizer
+
     new_parse = relecov_tools.metadata_homogeneizer.MetadataHomogeneizer(
         institution, directory, output
     )
@@ -482,6 +507,8 @@ def pipeline_manager(input, template, output, config):
     Create the symbolic links for the samples which are validated to prepare for
     bioinformatics pipeline execution.
     """
+    import relecov_tools.pipeline_manager
+
     new_launch = relecov_tools.pipeline_manager.PipelineManager(
         input, template, output, config
     )
@@ -519,6 +546,8 @@ def pipeline_manager(input, template, output, config):
 @click.option("-o", "--out_dir", type=click.Path(), help="Path to save output file/s")
 def build_schema(input_file, schema_base, draft_version, diff, out_dir):
     """Generates and updates JSON Schema files from Excel-based database definitions."""
+    import relecov_tools.build_schema
+
     schema_update = relecov_tools.build_schema.SchemaBuilder(
         input_file, schema_base, draft_version, diff, out_dir
     )
@@ -549,6 +578,8 @@ def build_schema(input_file, schema_base, draft_version, diff, out_dir):
 )
 def logs_to_excel(lab_code, output_folder, files):
     """Creates a merged xlsx report from all the log summary jsons given as input"""
+    import relecov_tools.log_summary
+
     all_logs = []
     full_paths = [os.path.realpath(f) for f in files]
     for file in full_paths:
@@ -587,6 +618,8 @@ def logs_to_excel(lab_code, output_folder, files):
 )
 def wrapper(config_file, output_folder):
     """Executes the modules in config file sequentially"""
+    import relecov_tools.dataprocess_wrapper
+
     process_wrapper = relecov_tools.dataprocess_wrapper.ProcessWrapper(
         config_file=config_file, output_folder=output_folder
     )
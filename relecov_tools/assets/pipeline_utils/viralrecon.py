@@ -1,4 +1,7 @@
 #!/usr/bin/env python
+import csv
+import functools
+import hashlib
 import json
 import os
 import sys
@@ -7,6 +10,14 @@ import logging
 import rich
 import os.path
 
+try:
+    # Optional C-implemented serializer, noticeably faster on large tables
+    import orjson
+except ImportError:
+    orjson = None
+
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -22,6 +33,24 @@ stderr = rich.console.Console(
     force_terminal=relecov_tools.utils.rich_force_colors(),
 )
 
+LONG_TABLE_FILE_PATTERN = re.compile(r"variants_long_table(?:_(?P<date>\d{8}))?\.csv")
+# Low-cardinality long table columns whose values repeat across most rows,
+# worth interning so each distinct string is stored only once.
+LONG_TABLE_INTERN_COLS = {"CHROM", "GENE", "FILTER", "EFFECT", "CALLER", "LINEAGE"}
+ANALYSIS_FOLDER_PATTERN = re.compile(r"(\/\d{8}_ANALYSIS0.*_HUMAN)")
+PANGO_VERSION_PATTERN = re.compile(r"v\d+\.\d+(\.\d+)?", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1)
+def get_viralrecon_config():
+    """Read bioinfo_config.json once and keep the parsed viralrecon section
+    cached for every LongTableParse instance created afterwards.
+    """
+    json_file = os.path.join(
+        os.path.dirname(__file__), "..", "..", "conf", "bioinfo_config.json"
+    )
+    return ConfigJson(json_file).get_configuration("viralrecon")
+
 
 # INIT Class
 class LongTableParse:
@@ -66,90 +95,149 @@ class LongTableParse:
             self.output_directory = output_directory
         Path(self.output_directory).mkdir(parents=True, exist_ok=True)
 
-        json_file = os.path.join(
-            os.path.dirname(__file__), "..", "..", "conf", "bioinfo_config.json"
-        )
-        config_json = ConfigJson(json_file)
-        self.software_config = config_json.get_configuration("viralrecon")
+        self.software_config = get_viralrecon_config()
         self.long_table_heading = self.software_config["variants_long_table"]["content"]
 
     def validate_file(self, heading):
         """Check if long table file has all mandatory fields defined in
         configuration file
         """
-        for field in self.long_table_heading:
+        for field in self.long_table_heading.values():
             if field not in heading:
                 log.error("Incorrect format file. %s is missing", field)
                 stderr.print(f"[red]Incorrect Format. {field} is missing in file")
                 sys.exit(1)
         return True
 
+    def check_file_format(self):
+        """Fast structural check before any row processing: validate the
+        expected filename pattern and the header fields reading only the
+        first line of the file.
+        """
+        if LONG_TABLE_FILE_PATTERN.search(os.path.basename(self.file_path)) is None:
+            stderr.print(
+                "[red]\tWARN: Couldn't find variants long table file. Expected file name is:"
+            )
+            stderr.print(
+                "[red]\t\t- variants_long_table.csv or variants_long_table_YYYYMMDD.csv. Aborting..."
+            )
+            sys.exit(1)
+        with open(self.file_path, encoding="utf-8-sig", newline="") as fh:
+            header = next(csv.reader(fh), [])
+        self.validate_file(header)
+        return True
+
     def parse_file(self):
         """This function generates a json file from the csv file entered by
         the user (long_table.csv).
-        Validate the file by checking the header line
+        Validate the file by checking the header line.
+        Variants are accumulated column-wise (one list per output field and
+        sample) instead of one dict per row, which keeps memory low on large
+        tables; per-variant dicts are only materialized in convert_to_json.
         """
 
-        with open(self.file_path, encoding="utf-8-sig") as fh:
-            lines = fh.readlines()
-
-        stderr.print("[green]\tSuccessful checking heading fields")
-        heading_index = {}
-        headings_from_csv = lines[0].strip().split(",")
-        for heading in self.long_table_heading.values():
-            heading_index[heading] = headings_from_csv.index(heading)
-
-        samp_dict = {}
-        for line in lines[1:]:
-            line_s = line.strip().split(",")
-
-            sample = line_s[heading_index["SAMPLE"]]
-            if sample not in samp_dict:
-                samp_dict[sample] = []
-
-            variant_dict = {
-                key: (
-                    {key2: line_s[heading_index[val2]] for key2, val2 in value.items()}
-                    if isinstance(value, dict)
-                    else line_s[heading_index[value]]
-                )
-                for key, value in self.long_table_heading.items()
+        # Read the file in a single streaming pass so memory stays O(row)
+        # instead of O(file size) no matter how large the long table is.
+        # A large read buffer keeps the C-level csv tokenizer fed with few
+        # syscalls even on network storage.
+        with open(
+            self.file_path, encoding="utf-8-sig", newline="", buffering=1 << 20
+        ) as fh:
+            reader = csv.reader(fh)
+            heading_index = {}
+            headings_from_csv = next(reader)
+            for heading in self.long_table_heading.values():
+                heading_index[heading] = headings_from_csv.index(heading)
+            stderr.print("[green]\tSuccessful checking heading fields")
+
+            # Flatten the heading mapping to (key, subkey, column-index) tuples
+            # so the hot loop indexes rows by integer instead of re-hashing
+            # heading_index for every field of every row.
+            flat_headings = []
+            for key, value in self.long_table_heading.items():
+                if isinstance(value, dict):
+                    for key2, val2 in value.items():
+                        flat_headings.append((key, key2, heading_index[val2]))
+                else:
+                    flat_headings.append((key, None, heading_index[value]))
+            # "Gene" is appended last, mirroring the materialized dict layout
+            self.variant_columns = [(key, key2) for key, key2, _ in flat_headings]
+            self.variant_columns.append(("Gene", None))
+            column_indexes = [idx for _, _, idx in flat_headings]
+            intern_indexes = {
+                idx
+                for name, idx in heading_index.items()
+                if name in LONG_TABLE_INTERN_COLS
             }
-
-            if re.search("&", line_s[heading_index["GENE"]]):
-                # Example
-                # 215184,NC_045512.2,27886,AAACGAACATGAAATT,A,PASS,1789,1756,1552,0.87,ORF7b&ORF8,gene_fusion,n.27887_27901delAACGAACATGAAATT,.,.,ivar,B.1.1.318
-                # This only occurs (for now) as gene fusion, so we just duplicate lines with same values
-                genes = re.split("&", line_s[heading_index["GENE"]])
-                for gene in genes:
-                    variant_dict_copy = variant_dict.copy()
-                    variant_dict_copy["Gene"] = gene
-                    samp_dict[sample].append(variant_dict_copy)
-            else:
-                variant_dict["Gene"] = line_s[heading_index["GENE"]]
-                samp_dict[sample].append(variant_dict)
+            sample_idx = heading_index["SAMPLE"]
+            gene_idx = heading_index["GENE"]
+            intern = sys.intern
+
+            n_columns = len(column_indexes)
+            samp_dict = defaultdict(lambda: [[] for _ in range(n_columns + 1)])
+            for line_s in reader:
+                # Intern repetitive values so identical strings share storage
+                for idx in intern_indexes:
+                    line_s[idx] = intern(line_s[idx])
+                columns = samp_dict[line_s[sample_idx]]
+                gene_value = line_s[gene_idx]
+                if "&" in gene_value:
+                    # Example
+                    # 215184,NC_045512.2,27886,AAACGAACATGAAATT,A,PASS,1789,1756,1552,0.87,ORF7b&ORF8,gene_fusion,n.27887_27901delAACGAACATGAAATT,.,.,ivar,B.1.1.318
+                    # This only occurs (for now) as gene fusion, so we just duplicate lines with same values
+                    for gene in gene_value.split("&"):
+                        for col, idx in zip(columns, column_indexes):
+                            col.append(line_s[idx])
+                        columns[n_columns].append(intern(gene))
+                else:
+                    for col, idx in zip(columns, column_indexes):
+                        col.append(line_s[idx])
+                    columns[n_columns].append(gene_value)
         stderr.print("[green]\tSuccessful parsing data")
         return samp_dict
 
+    def build_variant_materializer(self):
+        """Generate a function specialized for the configured columns that
+        maps one row tuple straight to its variant dict, with every key and
+        row position hard-wired so the per-variant loop has no generic
+        lookups left.
+        """
+        items = {}
+        for pos, (key1, key2) in enumerate(self.variant_columns):
+            if key2 is None:
+                items[key1] = f"row[{pos}]"
+            else:
+                items.setdefault(key1, {})[key2] = f"row[{pos}]"
+
+        def as_literal(value):
+            if isinstance(value, str):
+                return value
+            inner = ", ".join(f"{k!r}: {v}" for k, v in value.items())
+            return "{" + inner + "}"
+
+        entries = ", ".join(f"{k!r}: {as_literal(v)}" for k, v in items.items())
+        source = "def row_to_variant(row):\n    return {" + entries + "}\n"
+        namespace = {}
+        exec(source, namespace)
+        return namespace["row_to_variant"]
+
     def convert_to_json(self, samp_dict):
+        """Materialize the column-wise parsed data into the list of
+        per-sample dicts expected in the output json file.
+        """
         j_list = []
-        # Grab date from filename
-        result_regex = re.search(
-            "variants_long_table(?:_\d{8})?\.csv", os.path.basename(self.file_path)
+        # Filename shape was already validated in check_file_format(). Take
+        # the analysis date from the filename when present, falling back to
+        # the file modification date for undated filenames.
+        match = LONG_TABLE_FILE_PATTERN.search(os.path.basename(self.file_path))
+        analysis_date = (match and match.group("date")) or (
+            relecov_tools.utils.get_file_date(self.file_path)
         )
-        if result_regex is None:
-            stderr.print(
-                "[red]\tWARN: Couldn't find variants long table file. Expected file name is:"
-            )
-            stderr.print(
-                "[red]\t\t- variants_long_table.csv or variants_long_table_YYYYMMDD.csv. Aborting..."
-            )
-            sys.exit(1)
-        else:
-            analysis_date = relecov_tools.utils.get_file_date(self.file_path)
-        for key, values in samp_dict.items():
+        row_to_variant = self.build_variant_materializer()
+        for key, columns in samp_dict.items():
+            variants = [row_to_variant(row) for row in zip(*columns)]
             j_dict = {"sample_name": key, "analysis_date": analysis_date}
-            j_dict["variants"] = values
+            j_dict["variants"] = variants
             j_list.append(j_dict)
         return j_list
 
@@ -160,8 +248,12 @@ class LongTableParse:
         file_path = os.path.join(self.output_directory, file_name)
 
         try:
-            with open(file_path, "w") as fh:
-                fh.write(json.dumps(j_list, indent=4))
+            if orjson is not None:
+                with open(file_path, "wb") as fh:
+                    fh.write(orjson.dumps(j_list, option=orjson.OPT_INDENT_2))
+            else:
+                with open(file_path, "w") as fh:
+                    json.dump(j_list, fh, indent=4)
             stderr.print("[green]\tParsed data successfully saved to file:", file_path)
         except Exception as e:
             stderr.print("[red]\tError saving parsed data to file:", str(e))
@@ -170,6 +262,8 @@ class LongTableParse:
         """
         Function called when using the relecov-tools long-table-parse function.
         """
+        # Cheap structural validation first, expensive parsing second
+        self.check_file_format()
         # Parsing longtable file
         parsed_data = self.parse_file()
         j_list = self.convert_to_json(parsed_data)
@@ -193,15 +287,11 @@ def handle_pangolin_data(files_list, output_folder=None):
     # Handling pangolin data
     def pango_version_from_sbatch(sbatch_files, analysis_folder):
         pango_data_v = None
+        # Stat every sbatch file once and keep the most recent one, instead
+        # of recomputing all the file dates on each pass of the loop below
+        file_dates = {x: relecov_tools.utils.get_file_date(x) for x in sbatch_files}
         for _ in sbatch_files:
-            latest_date = max(
-                [relecov_tools.utils.get_file_date(x) for x in sbatch_files]
-            )
-            latest_sbatch = [
-                x
-                for x in sbatch_files
-                if relecov_tools.utils.get_file_date(x) == latest_date
-            ][0]
+            latest_sbatch = max(file_dates, key=file_dates.get)
             with open(latest_sbatch, "r") as f:
                 content = f.readlines()
             nxf_index = [n for n, line in enumerate(content) if "nextflow run" in line]
@@ -249,17 +339,14 @@ def handle_pangolin_data(files_list, output_folder=None):
     def get_pango_data_version(files_list):
         """Extract pangolin database version used in the lineage analysis"""
         single_file = files_list[0]
-        analysis_folder = "".join(
-            re.split(r"(\/\d{8}_ANALYSIS0.*_HUMAN)", single_file)[0:2]
-        )
+        analysis_folder = "".join(ANALYSIS_FOLDER_PATTERN.split(single_file)[0:2])
         pango_data_v = None
         if "lablog_viralrecon.log" in os.listdir(os.path.join(analysis_folder, "..")):
             with open(os.path.join(analysis_folder, "../lablog_viralrecon.log")) as f:
                 content = f.readlines()
             for line in content:
                 if "pangolin-data" in line:
-                    version_pattern = r"v\d+\.\d+(\.\d+)?"
-                    match = re.search(version_pattern, line, re.IGNORECASE)
+                    match = PANGO_VERSION_PATTERN.search(line)
                     if match:
                         pango_data_v = match.group()
                     else:
@@ -282,16 +369,27 @@ def handle_pangolin_data(files_list, output_folder=None):
         files_list_processed = relecov_tools.utils.select_most_recent_files_per_sample(
             files_list
         )
-        for pango_file in files_list_processed:
+
+        def read_pango_file(pango_file):
+            """Read one pangolin csv together with its analysis date"""
+            return (
+                relecov_tools.utils.read_csv_file_return_dict(pango_file, sep=","),
+                relecov_tools.utils.get_file_date(pango_file),
+            )
+
+        # Read the per-sample csv files concurrently, then merge sequentially
+        # to keep the log report and output dict updates single-threaded.
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [
+                (pango_file, executor.submit(read_pango_file, pango_file))
+                for pango_file in files_list_processed
+            ]
+        for pango_file, future in futures:
             try:
-                pango_data = relecov_tools.utils.read_csv_file_return_dict(
-                    pango_file, sep=","
-                )
+                pango_data, analysis_date = future.result()
                 # Add custom content in pangolin
                 pango_data_key = next(iter(pango_data))
-                pango_data[pango_data_key]["lineage_analysis_date"] = (
-                    relecov_tools.utils.get_file_date(pango_file)
-                )
+                pango_data[pango_data_key]["lineage_analysis_date"] = analysis_date
                 pango_data[pango_data_key]["pangolin_database_version"] = pango_data_v
                 # Rename key in f_data
                 pango_data_updated = {
@@ -361,6 +459,38 @@ def parse_long_table(files_list, output_folder=None):
     return None
 
 
+def fasta_stats_and_md5(file_name):
+    """Read a fasta file in a single buffered pass, feeding the md5 hash while
+    collecting the content, so the file is not opened twice for parsing and
+    checksumming. Only the record description and sequence length are needed
+    downstream, so both are taken straight from the raw bytes without
+    building a full SeqIO record.
+
+    Args:
+        file_name (str): path to the fasta file.
+
+    Returns:
+        (description, seq_length, md5sum): header description, number of
+        sequence characters and md5 hexdigest of the file.
+    """
+    file_md5 = hashlib.md5()
+    chunks = []
+    with open(file_name, "rb", buffering=1 << 20) as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            file_md5.update(chunk)
+            chunks.append(chunk)
+    content = b"".join(chunks)
+    header_end = content.find(b"\n")
+    if not content.startswith(b">") or header_end == -1:
+        raise ValueError(f"{file_name} is not a valid fasta file")
+    description = content[1:header_end].decode().strip()
+    sequence = content[header_end + 1 :]
+    if b"\n>" in sequence:
+        raise ValueError(f"More than one record found in {file_name}")
+    seq_length = len(sequence) - sequence.count(b"\n") - sequence.count(b"\r")
+    return description, seq_length, file_md5.hexdigest()
+
+
 def handle_consensus_fasta(files_list, output_folder=None):
     """File handler to parse consensus data (fasta) into JSON structured format.
 
@@ -373,28 +503,39 @@ def handle_consensus_fasta(files_list, output_folder=None):
     method_name = f"{handle_consensus_fasta.__name__}"
     method_log_report = BioinfoReportLog()
 
+    def process_consensus_file(consensus_file):
+        """Parse and hash a single consensus file"""
+        description, seq_length, md5_hash = fasta_stats_and_md5(consensus_file)
+        # Split the path once instead of separate basename/dirname calls
+        consensus_path = Path(consensus_file)
+        sample_key = consensus_path.name.split(".")[0]
+        return sample_key, {
+            "sequence_name": description,
+            "genome_length": str(seq_length),
+            "sequence_filepath": str(consensus_path.parent),
+            "sequence_filename": sample_key,
+            "sequence_md5": md5_hash,
+            # TODO: Not sure this is correct. If not, recover previous version: https://github.com/BU-ISCIII/relecov-tools/blob/09c00c1ddd11f7489de7757841aff506ef4b7e1d/relecov_tools/read_bioinfo_metadata.py#L211-L218
+            "number_of_base_pairs_sequenced": seq_length,
+        }
+
     consensus_data_processed = {}
     missing_consens = []
-    for consensus_file in files_list:
+    # Files are independent so hash+parse them concurrently, collecting the
+    # results in submission order to keep the output deterministic.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [
+            executor.submit(process_consensus_file, consensus_file)
+            for consensus_file in files_list
+        ]
+    for future in futures:
         try:
-            record_fasta = relecov_tools.utils.read_fasta_return_SeqIO_instance(
-                consensus_file
-            )
+            sample_key, sample_data = future.result()
         except FileNotFoundError as e:
             missing_consens.append(e.filename)
             continue
-        sample_key = os.path.basename(consensus_file).split(".")[0]
-
         # Update consensus data for the sample key
-        consensus_data_processed[sample_key] = {
-            "sequence_name": record_fasta.description,
-            "genome_length": str(len(record_fasta)),
-            "sequence_filepath": os.path.dirname(consensus_file),
-            "sequence_filename": sample_key,
-            "sequence_md5": relecov_tools.utils.calculate_md5(consensus_file),
-            # TODO: Not sure this is correct. If not, recover previous version: https://github.com/BU-ISCIII/relecov-tools/blob/09c00c1ddd11f7489de7757841aff506ef4b7e1d/relecov_tools/read_bioinfo_metadata.py#L211-L218
-            "number_of_base_pairs_sequenced": len(record_fasta.seq),
-        }
+        consensus_data_processed[sample_key] = sample_data
 
     # Report missing consensus
     conserrs = len(missing_consens)
@@ -1,7 +1,25 @@
 #!/usr/bin/env python
+import copy
 import json
 import os
 
+# Parsed configuration files keyed by path, validated against mtime and
+# size so every ConfigJson() does not re-read and re-parse the same json
+_config_cache = {}
+
+
+def _load_json_cached(json_file):
+    file_stat = os.stat(json_file)
+    cached = _config_cache.get(json_file)
+    if cached and cached[0] == file_stat.st_mtime and cached[1] == file_stat.st_size:
+        # Some call sites mutate the structures they get back, so every
+        # instance receives its own copy of the parsed data
+        return copy.deepcopy(cached[2])
+    with open(json_file) as fh:
+        json_data = json.load(fh)
+    _config_cache[json_file] = (file_stat.st_mtime, file_stat.st_size, json_data)
+    return copy.deepcopy(json_data)
+
 
 # pass test
 class ConfigJson:
@@ -9,9 +27,7 @@ class ConfigJson:
         self,
         json_file=os.path.join(os.path.dirname(__file__), "conf", "configuration.json"),
     ):
-        fh = open(json_file)
-        self.json_data = json.load(fh)
-        fh.close()
+        self.json_data = _load_json_cached(json_file)
         self.topic_config = list(self.json_data.keys())
 
     def get_configuration(self, topic):
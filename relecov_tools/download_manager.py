@@ -4,7 +4,6 @@ import logging
 import json
 import sys
 import os
-import yaml
 import warnings
 import rich.console
 import paramiko
@@ -46,6 +45,8 @@ class DownloadManager:
         download_option=None,
         output_location=None,
         target_folders=None,
+        buffer_size=None,
+        max_outstanding_reads=None,
     ):
         """Initializes the sftp object"""
         config_json = ConfigJson()
@@ -83,8 +84,7 @@ class DownloadManager:
                     "[red] Configuration file does not exist. " + conf_file + "!"
                 )
                 sys.exit(1)
-            with open(conf_file, "r") as fh:
-                config = yaml.load(fh, Loader=yaml.FullLoader)
+            config = relecov_tools.utils.read_yml_file(conf_file)
             try:
                 # self.sftp_server = config["sftp_server"]
                 # self.sftp_port = config["sftp_port"]
@@ -129,7 +129,11 @@ class DownloadManager:
         )
         # initialize the sftp client
         self.relecov_sftp = relecov_tools.sftp_client.SftpRelecov(
-            conf_file, sftp_user, sftp_passwd
+            conf_file,
+            sftp_user,
+            sftp_passwd,
+            buffer_size=buffer_size,
+            max_outstanding_reads=max_outstanding_reads,
         )
         self.finished_folders = {}
 
@@ -791,15 +795,24 @@ class DownloadManager:
             excel_df (dict(str:pandas.DataFrame)): Dict {name_of_excel_sheet:DataFrame}
             containing all sheets in the excel file as pandas dataframes.
         """
-        # Get every sheet from the first excel file
-        excel_df = read_excel(excel_file, dtype=str, sheet_name=None)
+        # Get every sheet from the first excel file. Prefer the Rust-based
+        # calamine engine when installed, which parses xlsx several times
+        # faster than openpyxl; otherwise keep the default engine.
+        try:
+            excel_df = read_excel(
+                excel_file, dtype=str, sheet_name=None, engine="calamine"
+            )
+        except (ImportError, ValueError):
+            # python-calamine not installed, or pandas < 2.2 which does not
+            # know the engine and raises ValueError instead
+            excel_df = read_excel(excel_file, dtype=str, sheet_name=None)
         meta_df = excel_df[metadata_sheet]
         if header_flag in meta_df.columns:
             return excel_df
-        header_row = None
-        for idx in range(len(meta_df)):
-            if any(meta_df.loc[idx, x] == header_flag for x in meta_df.columns):
-                header_row = idx
+        # Vectorized scan instead of per-cell .loc lookups row by row
+        header_mask = (meta_df == header_flag).any(axis=1)
+        matching_rows = meta_df.index[header_mask]
+        header_row = matching_rows[-1] if len(matching_rows) > 0 else None
         meta_df.columns = meta_df.iloc[header_row]
         excel_df[metadata_sheet] = meta_df.drop(meta_df.index[: (header_row + 1)])
         excel_df[metadata_sheet] = excel_df[metadata_sheet].reset_index(drop=True)
@@ -996,17 +1009,22 @@ class DownloadManager:
 
         Returns:
             fetched_files(list(str)): files list including the new compressed files
+            compressed_md5s(dict(str:str)): md5 hash of each new compressed file
         """
         compressed_files = list()
+        compressed_md5s = {}
         for file in files_to_compress:
             f_path = os.path.join(local_folder, file)
-            compressed = relecov_tools.utils.compress_file(f_path)
-            if not compressed:
+            # Hash the compressed stream while writing it so the new .gz
+            # does not have to be read back later just for its md5
+            compressed_md5 = relecov_tools.utils.compress_file_and_hash(f_path)
+            if not compressed_md5:
                 error_text = "Could not compress file %s, file not found" % str(file)
                 self.include_error(error_text, f_path)
                 continue
             # Remove file after compression is completed
             compressed_files.append(file)
+            compressed_md5s[file + ".gz"] = compressed_md5
             try:
                 os.remove(f_path)
             except (FileNotFoundError, PermissionError) as e:
@@ -1014,7 +1032,7 @@ class DownloadManager:
         fetched_files = [
             (fi + ".gz" if fi in compressed_files else fi) for fi in fetched_files
         ]
-        return fetched_files
+        return fetched_files, compressed_md5s
 
     def process_filedict(
         self, valid_filedict, clean_fetchlist, corrupted=[], md5miss=[]
@@ -1175,11 +1193,12 @@ class DownloadManager:
                 comp_files = str(len(files_to_compress))
                 log.info("Found %s uncompressed files, compressing...", comp_files)
                 stderr.print(f"Found {comp_files} uncompressed files, compressing...")
-                clean_fetchlist = self.compress_and_update(
+                clean_fetchlist, compressed_md5s = self.compress_and_update(
                     seqs_fetchlist, files_to_compress, local_folder
                 )
             else:
                 clean_fetchlist = seqs_fetchlist
+                compressed_md5s = {}
             clean_pathlist = [os.path.join(local_folder, fi) for fi in clean_fetchlist]
             not_md5sum = []
             if remote_md5sum:
@@ -1198,12 +1217,18 @@ class DownloadManager:
                             not_md5sum.append(f_name)
                         else:
                             log.info("File %s was compressed, creating md5hash", f_name)
-                        files_md5_dict[f_name] = relecov_tools.utils.calculate_md5(path)
+                        files_md5_dict[f_name] = compressed_md5s.get(
+                            f_name
+                        ) or relecov_tools.utils.calculate_md5(path)
             else:
-                md5_hashes = [
-                    relecov_tools.utils.calculate_md5(path) for path in clean_pathlist
-                ]
-                files_md5_dict = dict(zip(clean_fetchlist, md5_hashes))
+                files_md5_dict = {}
+                for fi in clean_fetchlist:
+                    md5_value = compressed_md5s.get(fi)
+                    if not md5_value:
+                        md5_value = relecov_tools.utils.calculate_md5(
+                            os.path.join(local_folder, fi)
+                        )
+                    files_md5_dict[fi] = md5_value
             for file in files_md5_dict.keys():
                 full_f_path = os.path.join(local_folder, file)
                 if not relecov_tools.utils.check_gzip_integrity(full_f_path):
@@ -126,8 +126,10 @@ class BioinfoMetadata:
                 msg="Select the software, pipeline or tool use in the bioinformatic analysis: "
             )
         self.software_name = software
-        available_software = self.get_available_software(self.bioinfo_json_file)
+        # Parse the configuration file once and reuse it for both the
+        # available software listing and the selected software scope
         bioinfo_config = ConfigJson(self.bioinfo_json_file)
+        available_software = bioinfo_config.topic_config
         if self.software_name in available_software:
             self.software_config = bioinfo_config.get_configuration(self.software_name)
         else:
@@ -176,11 +178,13 @@ class BioinfoMetadata:
                     f"No 'fn' (file pattern) found in '{self.software_name}.{topic_key}'.",
                 )
                 continue
+            # Compile each file pattern once instead of per scanned file
+            fn_pattern = re.compile(topic_scope["fn"])
             for tup in all_scanned_things:
                 matching_files = [
                     os.path.join(tup[0], file_name)
                     for file_name in tup[1]
-                    if re.search(topic_scope["fn"], file_name)
+                    if fn_pattern.search(file_name)
                 ]
                 if len(matching_files) >= 1:
                     files_found[topic_key] = matching_files
@@ -394,6 +398,7 @@ class BioinfoMetadata:
         errors = []
         field_errors = {}
         field_valid = {}
+        mapping_items = list(mapping_fields.items())
         for row in j_data:
             # TODO: We should consider an independent module that verifies that sample's name matches this pattern.
             #       If we add warnings within this module, every time mapping_over_table is invoked it will print redundant warings
@@ -405,11 +410,12 @@ class BioinfoMetadata:
                 )
                 continue
             sample_name = row["sequencing_sample_id"]
-            if sample_name in map_data.keys():
-                for field, value in mapping_fields.items():
+            sample_data = map_data.get(sample_name)
+            if sample_data is not None:
+                for field, value in mapping_items:
                     try:
                         # FIXME: we have to allow more than one data type to make json validation module work.
-                        row[field] = str(map_data[sample_name][value])
+                        row[field] = str(sample_data[value])
                         field_valid[sample_name] = {field: value}
                     except KeyError as e:
                         field_errors[sample_name] = {field: e}
@@ -417,7 +423,7 @@ class BioinfoMetadata:
                         continue
             else:
                 errors.append(sample_name)
-                for field in mapping_fields.keys():
+                for field, _ in mapping_items:
                     row[field] = "Not Provided [GENEPIO:0001668]"
         # work around when map_data comes from several per-sample tables/files instead of single table
         if len(table_name) > 2:
@@ -510,6 +516,25 @@ class BioinfoMetadata:
             )
             sys.exit(self.log_report.print_log_report(method_name, ["error"]))
         # Mapping multiqc sofware versions to j_data
+        # Software names and versions only depend on the software config and
+        # the parsed versions table, so resolve them once for all samples
+        software_content_details = self.software_config["workflow_summary"].get(
+            "content"
+        )
+        resolved_fields = {}
+        missing_version = None
+        for content_key, content_value in software_content_details.items():
+            for key, value in content_value.items():
+                # Add software versions
+                if "software_version" in content_key:
+                    try:
+                        resolved_fields[key] = program_versions[value]
+                    except KeyError as e:
+                        missing_version = {value: e}
+                        resolved_fields[key] = "Not Provided [GENEPIO:0001668]"
+                # Add software name
+                elif "software_name" in content_key:
+                    resolved_fields[key] = value
         field_errors = {}
         for row in j_data:
             # Get sample name to track whether version assignment was successful or not.
@@ -520,29 +545,9 @@ class BioinfoMetadata:
                     f'Sequencing_sample_id missing in {row.get("collecting_sample_id")}... Skipping...',
                 )
                 continue
-            sample_name = row["sequencing_sample_id"]
-            # Append software version and name
-            software_content_details = self.software_config["workflow_summary"].get(
-                "content"
-            )
-            for content_key, content_value in software_content_details.items():
-                for key, value in content_value.items():
-                    # Add software versions
-                    if "software_version" in content_key:
-                        try:
-                            row[key] = program_versions[value]
-                        except KeyError as e:
-                            field_errors[sample_name] = {value: e}
-                            row[key] = "Not Provided [GENEPIO:0001668]"
-                        continue
-                    # Add software name
-                    elif "software_name" in content_key:
-                        try:
-                            row[key] = value
-                        except KeyError as e:
-                            field_errors[sample_name] = {value: e}
-                            row[key] = "Not Provided [GENEPIO:0001668]"
-                        continue
+            if missing_version is not None:
+                field_errors[row["sequencing_sample_id"]] = missing_version
+            row.update(resolved_fields)
 
         # update progress log
         if len(field_errors) > 0:
@@ -718,12 +723,10 @@ class BioinfoMetadata:
             data_by_batch (dict(list(dict))): Dictionary containing parts of j_data corresponding to each
             different folder with samples (batch) included in the original json metadata used as input
         """
-        unique_batchs = set([x.get("r1_fastq_filepath") for x in j_data])
-        data_by_batch = {batch_dir: {} for batch_dir in unique_batchs}
-        for batch_dir in data_by_batch.keys():
-            data_by_batch[batch_dir]["j_data"] = [
-                samp for samp in j_data if samp.get("r1_fastq_filepath") == batch_dir
-            ]
+        data_by_batch = {}
+        for samp in j_data:
+            batch_dir = samp.get("r1_fastq_filepath")
+            data_by_batch.setdefault(batch_dir, {"j_data": []})["j_data"].append(samp)
         return data_by_batch
 
     def split_tables_by_batch(self, files_found_dict, batch_data, output_dir):
@@ -2,6 +2,7 @@ import logging
 import os
 import paramiko
 import rich.console
+import shutil
 import stat
 import sys
 import time
@@ -29,9 +30,21 @@ class SftpRelecov:
         "sftp_server": "server_name",
         "sftp_port": "port_number"
     }
+    Downloads are pipelined: buffer_size controls the local copy chunk size
+    and max_outstanding_reads the number of concurrent read requests kept
+    in flight against the server.
     """
 
-    def __init__(self, conf_file=None, username=None, password=None):
+    def __init__(
+        self,
+        conf_file=None,
+        username=None,
+        password=None,
+        buffer_size=None,
+        max_outstanding_reads=None,
+    ):
+        self.buffer_size = buffer_size or 131072
+        self.max_outstanding_reads = max_outstanding_reads or 64
         if conf_file is None:
             config_json = ConfigJson()
             self.sftp_server = config_json.get_topic_data("sftp_handle", "sftp_server")
@@ -189,7 +202,14 @@ class SftpRelecov:
             return True
         else:
             try:
-                self.sftp.get(file, destination)
+                # Keep several read requests in flight instead of waiting for
+                # each chunk roundtrip, which dominates on high-latency links
+                with self.sftp.open(file, "rb") as remote_fh:
+                    remote_fh.prefetch(
+                        remote_fh.stat().st_size, self.max_outstanding_reads
+                    )
+                    with open(destination, "wb") as local_fh:
+                        shutil.copyfileobj(remote_fh, local_fh, self.buffer_size)
                 return True
             except FileNotFoundError as e:
                 log.error("Unable to fetch file %s ", e)
@@ -2,19 +2,21 @@
 """
 Common utility function used for relecov_tools package.
 """
+import copy
+import csv
 import os
 import sys
 import glob
 import hashlib
 import logging
-import questionary
 import json
 import openpyxl
 import yaml
 import gzip
 import re
 import shutil
-from itertools import islice
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from Bio import SeqIO
 from rich.console import Console
 from datetime import datetime
@@ -22,6 +24,27 @@ from tabulate import tabulate
 import openpyxl.utils
 import openpyxl.styles
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # SIMD-accelerated gzip, several times faster than the stdlib deflate
+    from isal import igzip as gzip_mod
+except ImportError:
+    gzip_mod = gzip
+
+_MD5_CLEAN_TABLE = str.maketrans("", "", "*'\"")
+_MD5_PATH_PATTERN = re.compile(r"[\\/]")
+
+try:
+    # The C-backed loader parses the same yaml far faster when libyaml
+    # is available
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
 
 log = logging.getLogger(__name__)
 
@@ -53,6 +76,9 @@ def get_files_match_condition(condition):
 
 def read_json_file(j_file):
     """Read json file."""
+    if orjson is not None:
+        with open(j_file, "rb") as fh:
+            return orjson.loads(fh.read())
     with open(j_file, "r") as fh:
         try:
             data = json.load(fh)
@@ -66,32 +92,42 @@ def read_excel_file(f_name, sheet_name, header_flag, leave_empty=True):
     """Read the input excel file and give the information in a list
     of dictionaries
     """
-    wb_file = openpyxl.load_workbook(f_name, data_only=True)
-    ws_metadata_lab = wb_file[sheet_name]
+    # read_only streams plain value tuples instead of building the whole
+    # Cell graph in memory
+    wb_file = openpyxl.load_workbook(f_name, data_only=True, read_only=True)
     try:
-        heading_row = [
-            idx + 1 for idx, x in enumerate(ws_metadata_lab.values) if header_flag in x
-        ][0]
-    except IndexError:
-        raise KeyError(f"Header flag '{header_flag}' could not be found in {f_name}")
-    heading = [str(i.value).strip() for i in ws_metadata_lab[heading_row] if i.value]
-    ws_data = []
-    for row in islice(ws_metadata_lab.values, heading_row, ws_metadata_lab.max_row):
-        l_row = list(row)
-        # Ignore the empty rows
-        if all(cell is None for cell in l_row):
-            continue
-        data_row = {}
-        for idx in range(0, len(heading)):
-            if l_row[idx] is None:
-                if leave_empty:
-                    data_row[heading[idx]] = None
-                else:
-                    data_row[heading[idx]] = "Not Provided [GENEPIO:0001668]"
-            else:
-                data_row[heading[idx]] = l_row[idx]
-        ws_data.append(data_row)
-
+        ws_metadata_lab = wb_file[sheet_name]
+        rows_iter = ws_metadata_lab.iter_rows(values_only=True)
+        heading_row = None
+        for idx, row in enumerate(rows_iter, start=1):
+            if header_flag in row:
+                heading_row = idx
+                heading = [str(value).strip() for value in row if value]
+                break
+        if heading_row is None:
+            raise KeyError(
+                f"Header flag '{header_flag}' could not be found in {f_name}"
+            )
+        empty_value = None if leave_empty else "Not Provided [GENEPIO:0001668]"
+        n_columns = len(heading)
+        ws_data = []
+        for row in rows_iter:
+            # Ignore the empty rows
+            if all(cell is None for cell in row):
+                continue
+            # Streamed rows may be trimmed after the last filled cell
+            if len(row) < n_columns:
+                row = row + (None,) * (n_columns - len(row))
+            ws_data.append(
+                dict(
+                    zip(
+                        heading,
+                        [empty_value if cell is None else cell for cell in row],
+                    )
+                )
+            )
+    finally:
+        wb_file.close()
     return ws_data, heading_row
 
 
@@ -109,33 +145,30 @@ def read_csv_file_return_dict(file_name, sep=None, key_position=None):
     the index value of the key position is used as key. If sep is None then
     try to assert a separator automaticallly depending on file extension.
     """
-    try:
-        with open(file_name, "r") as fh:
-            lines = fh.readlines()
-    except FileNotFoundError:
-        raise
     if sep is None:
         file_extension = os.path.splitext(file_name)[1]
         extdict = {".csv": ",", ".tsv": "\t", ".tab": "\t"}
         # Use space as a default separator, None would also be valid
         sep = extdict.get(file_extension, " ")
-    heading = lines[0].strip().split(sep)
-    if len(heading) == 1:
-        return {"ERROR": "not valid format"}
     file_data = {}
-    for line in lines[1:]:
-        line_s = line.strip().split(sep)
-        if key_position is None:
-            file_data[line_s[0]] = {}
-            for idx in range(1, len(heading)):
-                file_data[line_s[0]][heading[idx]] = line_s[idx]
-        else:
-            file_data[line_s[key_position]] = {}
-            for idx in range(len(heading)):
-                if idx == key_position:
-                    continue
-                file_data[line_s[key_position]][heading[idx]] = line_s[idx]
-
+    with open(file_name, "r", newline="") as fh:
+        reader = csv.reader(fh, delimiter=sep)
+        heading = next(reader, [])
+        if len(heading) <= 1:
+            return {"ERROR": "not valid format"}
+        for line_s in reader:
+            if not line_s:
+                continue
+            if key_position is None:
+                file_data[line_s[0]] = {
+                    heading[idx]: line_s[idx] for idx in range(1, len(heading))
+                }
+            else:
+                file_data[line_s[key_position]] = {
+                    heading[idx]: line_s[idx]
+                    for idx in range(len(heading))
+                    if idx != key_position
+                }
     return file_data
 
 
@@ -147,33 +180,44 @@ def read_fasta_return_SeqIO_instance(file_name):
         raise
 
 
+# Parsed yaml files keyed by (path, mtime, size) so repeated loads of an
+# unchanged file skip the parser
+_yaml_cache = {}
+
+
 def read_yml_file(file_name):
     """Read yml file"""
-    with open(file_name, "r") as fh:
-        try:
-            return yaml.safe_load(fh)
-        except yaml.YAMLError:
-            raise
+    file_stat = os.stat(file_name)
+    cache_key = (file_name, file_stat.st_mtime_ns, file_stat.st_size)
+    if cache_key not in _yaml_cache:
+        with open(file_name, "r") as fh:
+            try:
+                _yaml_cache[cache_key] = yaml.load(fh, Loader=YamlSafeLoader)
+            except yaml.YAMLError:
+                raise
+    # Callers may mutate the returned config, so hand out a copy
+    return copy.deepcopy(_yaml_cache[cache_key])
 
 
 def get_md5_from_local_folder(local_folder):
     """Fetch the md5 values for each file in the file list"""
     md5_results = {}
-    reg_for_md5 = os.path.join(local_folder, "*.md5")
-    # reg_for_non_md5 = os.path.join(local_folder, "*[!.md5]")
-    md5_files = glob.glob(reg_for_md5)
+    # A single scandir pass lists the md5 files and checks their
+    # companion files without one stat call per file
+    with os.scandir(local_folder) as dir_iter:
+        entries = {entry.name: entry for entry in dir_iter if entry.is_file()}
+    md5_files = [name for name in entries if name.endswith(".md5")]
     if not md5_files:
         return False
-    else:
-        for md5_file in md5_files:
-            file_path_name, f_ext = os.path.splitext(md5_file)
-            if not file_exists(file_path_name):
-                log.error("Found md5 file but not %s", file_path_name)
-                continue
-            file_name = os.path.basename(file_path_name)
-            fh = open(md5_file, "r")
+    for md5_name in md5_files:
+        file_name = md5_name[:-4]
+        if file_name not in entries:
+            log.error(
+                "Found md5 file but not %s", os.path.join(local_folder, file_name)
+            )
+            continue
+        with open(entries[md5_name].path, "r") as fh:
             md5_results[file_name] = fh.read()
-            fh.close()
     return md5_results
 
 
@@ -193,37 +237,72 @@ def read_md5_checksum(file_name, avoid_chars=list()):
             content = file.read()
     except FileNotFoundError:
         raise
-    clean_content = content.replace("*", "")
-    lines = clean_content.splitlines()
-    translation = str.maketrans("", "", "'\"")
-    if any("\t" in line for line in lines):
-        lines = [line.strip().translate(translation).split("\t") for line in lines]
-    elif any("," in line for line in lines):
-        lines = [line.strip().translate(translation).split(",") for line in lines]
+    # Strip asterisks and quotes from the whole buffer in a single pass and
+    # detect the separator on it instead of re-scanning every line
+    clean_content = content.translate(_MD5_CLEAN_TABLE)
+    if "\t" in clean_content:
+        sep = "\t"
+    elif "," in clean_content:
+        sep = ","
     else:
-        lines = [line.strip().translate(translation).split() for line in lines]
-    clean_lines = [
-        x for x in lines if not any(ch in string for ch in avoid_chars for string in x)
-    ]
+        # None splits on any whitespace run
+        sep = None
+    lines = [line.strip().split(sep) for line in clean_content.splitlines()]
+    if avoid_chars:
+        # One compiled alternation scans each field once instead of one
+        # substring search per avoided element
+        avoid_pattern = re.compile("|".join(map(re.escape, avoid_chars)))
+        clean_lines = [x for x in lines if not any(avoid_pattern.search(s) for s in x)]
+    else:
+        clean_lines = lines
     # md5sum should always have 2 columns: hash - path
     md5_lines = [line for line in clean_lines if len(line) == 2]
     if not md5_lines:
         return False
-    # split paths for both windows "\" and linux "/" using regex [\\/]
-    hash_dict = {re.split(r"[\\/]", line[1])[-1]: line[0].lower() for line in md5_lines}
+    # split paths for both windows "\" and linux "/"
+    hash_dict = {
+        _MD5_PATH_PATTERN.split(line[1])[-1]: line[0].lower() for line in md5_lines
+    }
     return hash_dict
 
 
 def delete_local_folder(folder):
     """Delete download folder because files does not complain requisites"""
     log.info("Deleting local folder %s", folder)
-    shutil.rmtree(folder, ignore_errors=True)
+
+    def remove_entry(entry):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path, ignore_errors=True)
+        else:
+            safe_remove(entry.path)
+
+    try:
+        with os.scandir(folder) as dir_iter:
+            entries = list(dir_iter)
+    except OSError:
+        return True
+    # Delete entries concurrently: on network storage every unlink is a
+    # synchronous round trip, so threads overlap the latency
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(remove_entry, entries))
+    try:
+        os.rmdir(folder)
+    except OSError:
+        pass
     return True
 
 
 def calculate_md5(file_name):
     """Calculate the md5 value for the file name"""
-    return hashlib.md5(open(file_name, "rb").read()).hexdigest()
+    with open(file_name, "rb") as fh:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(fh, "md5").hexdigest()
+        # Python < 3.11: hash in fixed-size chunks instead of loading
+        # the whole file in memory
+        md5_hash = hashlib.md5()
+        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+            md5_hash.update(chunk)
+        return md5_hash.hexdigest()
 
 
 def write_md5_file(file_name, md5_value):
@@ -235,16 +314,21 @@ def write_md5_file(file_name, md5_value):
 
 def create_md5_files(local_folder, file_list):
     """Create the md5 files and return their value"""
+
+    def hash_and_write(file_name):
+        file_path = os.path.join(local_folder, file_name)
+        md5_value = calculate_md5(file_path)
+        write_md5_file(file_path + ".md5", md5_value)
+        return md5_value
+
     md5_results = {}
-    for file_name in file_list:
-        md5_results[file_name] = [
-            local_folder,
-            calculate_md5(os.path.join(local_folder, file_name)),
-        ]
-        md5_file_name = file_name + ".md5"
-        write_md5_file(
-            os.path.join(local_folder, md5_file_name), md5_results[file_name][1]
-        )
+    # hashlib releases the GIL while digesting, so hashing the batch in a
+    # thread pool scales with the available cores and the .md5 writes
+    # overlap with the reads of the next files
+    with ThreadPoolExecutor() as executor:
+        md5_hashes = executor.map(hash_and_write, file_list)
+        for file_name, md5_value in zip(file_list, md5_hashes):
+            md5_results[file_name] = [local_folder, md5_value]
     return md5_results
 
 
@@ -257,8 +341,16 @@ def save_local_md5(file_name, md5_value):
 
 def write_json_fo_file(data, file_name):
     """Write metadata to json file"""
-    with open(file_name, "w", encoding="utf-8") as fh:
-        fh.write(json.dumps(data, indent=4, sort_keys=True, ensure_ascii=False))
+    if orjson is not None:
+        with open(file_name, "wb") as fh:
+            fh.write(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+            )
+        return True
+    # json.dump streams into the write buffer instead of materializing the
+    # whole serialized blob as one string first
+    with open(file_name, "w", encoding="utf-8", buffering=1 << 20) as fh:
+        json.dump(data, fh, indent=4, sort_keys=True, ensure_ascii=False)
     return True
 
 
@@ -268,14 +360,77 @@ def compress_file(file):
     Args:
         file (str): path to the given file
     """
+    if shutil.which("pigz"):
+        # pigz deflates independent blocks on every core; keep the original
+        # file and overwrite any stale .gz to match the in-process path
+        pigz_run = subprocess.run(
+            ["pigz", "--keep", "--force", file], capture_output=True
+        )
+        if pigz_run.returncode == 0:
+            return True
+        if not os.path.isfile(file):
+            return False
+        # On any other pigz failure fall back to in-process compression
     try:
-        with open(file, "rb") as raw, gzip.open(f"{file}.gz", "wb") as comp:
-            comp.writelines(raw)
+        with open(file, "rb") as raw, gzip_mod.open(f"{file}.gz", "wb") as comp:
+            # Copy in large blocks: writelines would issue one tiny write
+            # per newline found in the raw bytes
+            shutil.copyfileobj(raw, comp, 1024 * 1024)
         return True
     except FileNotFoundError:
         return False
 
 
+class _HashingWriter:
+    """File-object wrapper feeding every written block to an md5 digest"""
+
+    def __init__(self, fh):
+        self.fh = fh
+        self.md5 = hashlib.md5()
+
+    def write(self, data):
+        self.md5.update(data)
+        return self.fh.write(data)
+
+    def flush(self):
+        return self.fh.flush()
+
+
+def compress_file_and_hash(file):
+    """Compress a given file with gzip like compress_file, hashing the
+    compressed stream while it is written so the resulting .gz does not
+    need to be re-read to obtain its md5
+
+    Args:
+        file (str): path to the given file
+
+    Returns:
+        str: md5 hexdigest of the created .gz file, False if file is missing
+    """
+    if shutil.which("pigz") and os.path.isfile(file):
+        # pigz deflates on every core; streaming its stdout through the
+        # digest into the .gz keeps the single-pass md5
+        md5_hash = hashlib.md5()
+        with open(f"{file}.gz", "wb") as out:
+            pigz_proc = subprocess.Popen(
+                ["pigz", "--keep", "--stdout", file], stdout=subprocess.PIPE
+            )
+            for chunk in iter(lambda: pigz_proc.stdout.read(1024 * 1024), b""):
+                md5_hash.update(chunk)
+                out.write(chunk)
+            if pigz_proc.wait() == 0:
+                return md5_hash.hexdigest()
+        # On any pigz failure fall back to in-process compression
+    try:
+        with open(file, "rb") as raw, open(f"{file}.gz", "wb") as out:
+            tee = _HashingWriter(out)
+            with gzip_mod.open(tee, "wb") as comp:
+                shutil.copyfileobj(raw, comp, 1024 * 1024)
+        return tee.md5.hexdigest()
+    except FileNotFoundError:
+        return False
+
+
 def check_gzip_integrity(file_path):
     """Check if a compressed file is not corrupted"""
     chunksize = 100000000  # 10 Mbytes
@@ -311,43 +466,59 @@ stderr = Console(
 
 
 def prompt_text(msg):
+    import questionary
+
     source = questionary.text(msg).unsafe_ask()
     return source
 
 
 def prompt_password(msg):
+    import questionary
+
     source = questionary.password(msg).unsafe_ask()
     return source
 
 
 def prompt_tmp_dir_path():
+    import questionary
+
     stderr.print("Temporal directory destination to execute service")
     source = questionary.path("Source path").unsafe_ask()
     return source
 
 
 def prompt_selection(msg, choices):
+    import questionary
+
     selection = questionary.select(msg, choices=choices).unsafe_ask()
     return selection
 
 
 def prompt_path(msg):
+    import questionary
+
     source = questionary.path(msg).unsafe_ask()
     return source
 
 
 def prompt_yn_question(msg):
+    import questionary
+
     confirmation = questionary.confirm(msg).unsafe_ask()
     return confirmation
 
 
 def prompt_skip_folder_creation():
+    import questionary
+
     stderr.print("Do you want to skip folder creation? (Y/N)")
     confirmation = questionary.confirm("Skip?", default=False).unsafe_ask()
     return confirmation
 
 
 def prompt_checkbox(msg, choices):
+    import questionary
+
     selected_options = questionary.checkbox(msg, choices=choices).unsafe_ask()
     return selected_options
 
@@ -395,12 +566,8 @@ def select_most_recent_files_per_sample(paths_list):
         stderr.print(
             f"\tMore than one file found for sample {sample_name}. Selecting the most recent one."
         )
-        # Sort files by modification time (most recent first)
-        sorted_files = sorted(
-            file_paths, key=lambda file_path: os.path.getmtime(file_path), reverse=True
-        )
-        # Select the most recent file
-        selected_file = sorted_files[0]
+        # Select the most recent file, no need to fully sort the group
+        selected_file = max(file_paths, key=os.path.getmtime)
         stderr.print(f"\tSelected file for sample {sample_name}: {selected_file}")
         # Remove other files for the same sample from the filtered_files dictionary
         filename_groups[sample_name] = [selected_file]